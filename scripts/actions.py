@@ -12,9 +12,10 @@ Action types:
 - reset: Reset form
 """
 
-from typing import Dict, Any, Optional, List, Literal
+from typing import Dict, Any, Optional, List, Literal, Callable, Union, FrozenSet
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from catalog import _DATACLASS_OPTIONS
 
 
 class ActionType(str, Enum):
@@ -27,21 +28,25 @@ class ActionType(str, Enum):
     RESET = "reset"
 
 
-class HttpMethod(str, Enum):
-    """HTTP methods"""
-    GET = "GET"
-    POST = "POST"
-    PUT = "PUT"
-    PATCH = "PATCH"
-    DELETE = "DELETE"
+# Standard HTTP methods for ApiConfig.method (not enforced; check with is_valid_http_method())
+HTTP_METHODS: FrozenSet[str] = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
 
+# Defaults shared by the dataclasses and the dict-building helpers (api_call, ActionBatch)
+_DEFAULT_BODY_MAPPING = "auto"
+_DEFAULT_ERROR_TEXT = "Operation failed"
 
-@dataclass
+
+def is_valid_http_method(method: str) -> bool:
+    """Check whether method is one of HTTP_METHODS (opt-in; constructors do not validate methods)"""
+    return isinstance(method, str) and method in HTTP_METHODS
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ApiConfig:
     """API call configuration"""
     endpoint: str
-    method: str = "POST"
-    bodyMapping: str = "auto"  # "auto" | {fieldName: targetKey}
+    method: str = "POST"  # See HTTP_METHODS
+    bodyMapping: str = _DEFAULT_BODY_MAPPING  # "auto" | {fieldName: targetKey}
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -51,7 +56,7 @@ class ApiConfig:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ConfirmConfig:
     """Confirmation dialog configuration"""
     title: str = "Confirm Action"
@@ -66,11 +71,11 @@ class ConfirmConfig:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FeedbackConfig:
     """User feedback configuration"""
     successText: str = "Operation successful"
-    errorText: str = "Operation failed"
+    errorText: str = _DEFAULT_ERROR_TEXT
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -79,13 +84,16 @@ class FeedbackConfig:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CallbackConfig:
     """Callback configuration"""
-    onSuccess: List[Dict[str, Any]] = field(default_factory=list)
-    onError: List[Dict[str, Any]] = field(default_factory=list)
+    onSuccess: Optional[List[Dict[str, Any]]] = None
+    onError: Optional[List[Dict[str, Any]]] = None
     feedback: Optional[FeedbackConfig] = None
 
+    def is_empty(self) -> bool:
+        return not (self.onSuccess or self.onError or self.feedback)
+
     def to_dict(self) -> Dict[str, Any]:
         result = {}
         if self.onSuccess:
@@ -97,7 +105,7 @@ class CallbackConfig:
         return result
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ActionSchema:
     """
     Action Schema v0.8.0
@@ -113,7 +121,7 @@ class ActionSchema:
         }
     }
     """
-    type: ActionType
+    type: Union[ActionType, str]  # Stored as the plain string value, e.g. "api_call"
 
     # api_call config
     api: Optional[ApiConfig] = None
@@ -133,64 +141,89 @@ class ActionSchema:
     confirm: Optional[ConfirmConfig] = None
     callbacks: Optional[CallbackConfig] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        result = {"type": self.type.value}
+    def __post_init__(self):
+        # Validates plain strings and unwraps enum members, so later compares are plain str compares
+        self.type = ActionType(self.type).value
 
-        if self.type == ActionType.API_CALL and self.api:
-            result["api"] = self.api.to_dict()
-
-        if self.type == ActionType.NAVIGATE and self.url:
-            result["url"] = self.url
-            if self.target != "_self":
-                result["target"] = self.target
-
-        if self.type == ActionType.EMIT_EVENT:
-            if self.event:
-                result["event"] = self.event
-            if self.payload:
-                result["payload"] = self.payload
+    def to_dict(self) -> Dict[str, Any]:
+        result = {"type": self.type}
 
-        if self.type in [ActionType.OPEN_MODAL, ActionType.CLOSE_MODAL] and self.modalId:
-            result["modalId"] = self.modalId
+        emit = _EMITTERS.get(self.type)
+        if emit:
+            emit(self, result)
 
         if self.confirm:
             result["confirm"] = self.confirm.to_dict()
 
-        if self.callbacks:
-            callbacks_dict = self.callbacks.to_dict()
-            if callbacks_dict:
-                result["callbacks"] = callbacks_dict
+        if self.callbacks and not self.callbacks.is_empty():
+            result["callbacks"] = self.callbacks.to_dict()
 
         return result
 
 
+# ==================== Per-type Emitters ====================
+
+def _emit_api_call(action: ActionSchema, result: Dict[str, Any]) -> None:
+    if action.api:
+        result["api"] = action.api.to_dict()
+
+
+def _emit_navigate(action: ActionSchema, result: Dict[str, Any]) -> None:
+    if action.url:
+        result["url"] = action.url
+        if action.target != "_self":
+            result["target"] = action.target
+
+
+def _emit_event(action: ActionSchema, result: Dict[str, Any]) -> None:
+    if action.event:
+        result["event"] = action.event
+    if action.payload:
+        result["payload"] = action.payload
+
+
+def _emit_modal(action: ActionSchema, result: Dict[str, Any]) -> None:
+    if action.modalId:
+        result["modalId"] = action.modalId
+
+
+# Type-specific fields written by ActionSchema.to_dict (reset has none)
+_EMITTERS: Dict[ActionType, Callable[[ActionSchema, Dict[str, Any]], None]] = {
+    ActionType.API_CALL: _emit_api_call,
+    ActionType.NAVIGATE: _emit_navigate,
+    ActionType.EMIT_EVENT: _emit_event,
+    ActionType.OPEN_MODAL: _emit_modal,
+    ActionType.CLOSE_MODAL: _emit_modal,
+}
+
+
 # ==================== Convenience Constructors ====================
 
 def api_call(
     endpoint: str,
     method: str = "POST",
     success_redirect: Optional[str] = None,
-    success_message: str = "Operation successful",
+    success_message: Optional[str] = None,
     confirm: Optional[ConfirmConfig] = None
 ) -> Dict[str, Any]:
-    """Create API call action"""
-    callbacks = None
+    """Create API call action (builds the dict directly, without ActionSchema)"""
+    action: Dict[str, Any] = {
+        "type": "api_call",
+        "api": {"endpoint": endpoint, "method": method, "bodyMapping": _DEFAULT_BODY_MAPPING}
+    }
+    if confirm:
+        action["confirm"] = confirm.to_dict()
+
+    # Callbacks are only emitted when a redirect or success message is requested
     if success_redirect or success_message:
-        on_success = []
+        callbacks: Dict[str, Any] = {}
         if success_redirect:
-            on_success.append({"type": "navigate", "url": success_redirect})
-        callbacks = CallbackConfig(
-            onSuccess=on_success if on_success else None,
-            feedback=FeedbackConfig(successText=success_message)
-        )
+            callbacks["onSuccess"] = [{"type": "navigate", "url": success_redirect}]
+        if success_message:
+            callbacks["feedback"] = {"successText": success_message, "errorText": _DEFAULT_ERROR_TEXT}
+        action["callbacks"] = callbacks
 
-    action = ActionSchema(
-        type=ActionType.API_CALL,
-        api=ApiConfig(endpoint=endpoint, method=method),
-        confirm=confirm,
-        callbacks=callbacks
-    )
-    return action.to_dict()
+    return action
 
 
 def navigate(url: str, target: str = "_self") -> Dict[str, Any]:
@@ -251,6 +284,83 @@ def delete_with_confirm(
     )
 
 
+# ==================== Batch Emission ====================
+
+class ActionBatch:
+    """
+    Column-oriented batch of actions
+
+    Each field lives in its own list, so renderers emitting many similar
+    actions (e.g. a delete button per table row) avoid one ActionSchema
+    instance per action. to_dicts() produces the same dicts as
+    ActionSchema.to_dict() (confirm/callbacks are not supported).
+
+    Example:
+        batch = ActionBatch()
+        for row in rows:
+            batch.add("api_call", endpoint=f"/api/users/{row['id']}", method="DELETE")
+        row_actions = batch.to_dicts()
+    """
+
+    def __init__(self):
+        self.types: List[str] = []
+        self.endpoints: List[Optional[str]] = []
+        self.methods: List[str] = []
+        self.urls: List[Optional[str]] = []
+        self.targets: List[str] = []
+        self.events: List[Optional[str]] = []
+        self.payloads: List[Optional[Dict[str, Any]]] = []
+        self.modal_ids: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def add(
+        self,
+        action_type: Union[ActionType, str],
+        endpoint: Optional[str] = None,
+        method: str = "POST",
+        url: Optional[str] = None,
+        target: str = "_self",
+        event: Optional[str] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        modal_id: Optional[str] = None
+    ) -> None:
+        self.types.append(ActionType(action_type).value)
+        self.endpoints.append(endpoint)
+        self.methods.append(method)
+        self.urls.append(url)
+        self.targets.append(target)
+        self.events.append(event)
+        self.payloads.append(payload)
+        self.modal_ids.append(modal_id)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        result = []
+        append = result.append
+        for action_type, endpoint, method, url, target, event, payload, modal_id in zip(
+                self.types, self.endpoints, self.methods, self.urls,
+                self.targets, self.events, self.payloads, self.modal_ids):
+            action = {"type": action_type}
+            if action_type == "api_call":
+                if endpoint is not None:
+                    action["api"] = {"endpoint": endpoint, "method": method, "bodyMapping": _DEFAULT_BODY_MAPPING}
+            elif action_type == "navigate":
+                if url:
+                    action["url"] = url
+                    if target != "_self":
+                        action["target"] = target
+            elif action_type == "emit_event":
+                if event:
+                    action["event"] = event
+                if payload:
+                    action["payload"] = payload
+            elif modal_id and action_type != "reset":
+                action["modalId"] = modal_id
+            append(action)
+        return result
+
+
 if __name__ == "__main__":
     import json
 
@@ -275,3 +385,9 @@ if __name__ == "__main__":
 
     print("\n[6] Reset form:")
     print(json.dumps(reset(), indent=2, ensure_ascii=False))
+
+    print("\n[7] Batch (one delete per row):")
+    batch = ActionBatch()
+    for row_id in (1, 2):
+        batch.add(ActionType.API_CALL, endpoint=f"/api/users/{row_id}", method="DELETE")
+    print(json.dumps(batch.to_dicts(), indent=2, ensure_ascii=False))
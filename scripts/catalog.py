@@ -13,10 +13,36 @@ v0.8.0 component list (12):
 - Embed: WebView
 """
 
-from typing import Dict, Any, Optional, List, Set
+import json
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, Mapping, FrozenSet, KeysView
 from dataclasses import dataclass, field
 from enum import Enum
 
+# dataclass(slots=True) requires Python 3.10+; the other scripts import this instead of redefining it
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_EMPTY_PROPS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze(value: Any) -> Any:
+    """Deep read-only copy: dicts become mapping proxies, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Mutable deep copy of a _freeze() result"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
 
 class ComponentCategory(Enum):
     """Component categories"""
@@ -45,16 +71,35 @@ class FormFieldType(Enum):
     FILE = "file"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ComponentSchema:
     """Component schema definition"""
     type: str
     category: ComponentCategory
-    required_props: List[str] = field(default_factory=list)
-    optional_props: Dict[str, Any] = field(default_factory=dict)
+    required_props: Tuple[str, ...] = ()
+    optional_props: Optional[Dict[str, Any]] = None  # None becomes a new empty dict
     supports_children: bool = False
     supports_actions: bool = False
     description: str = ""
+    # Set view of required_props for bulk "what is missing" checks
+    required_props_fs: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.required_props = tuple(self.required_props)
+        self.required_props_fs = frozenset(self.required_props)
+        if self.optional_props is None:
+            self.optional_props = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type,
+            "category": self.category.value,
+            "required_props": list(self.required_props),
+            "optional_props": dict(self.optional_props),
+            "supports_children": self.supports_children,
+            "supports_actions": self.supports_actions,
+            "description": self.description
+        }
 
 
 class ComponentCatalog:
@@ -72,20 +117,29 @@ class ComponentCatalog:
     Embed    (1): WebView
     """
 
-    _instance: Optional['ComponentCatalog'] = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    # Fallback component used when a component of the given category cannot be rendered
+    _FALLBACK_BY_CATEGORY: Dict[ComponentCategory, str] = {
+        ComponentCategory.DISPLAY: "Markdown",
+        ComponentCategory.CARD: "Card",
+        ComponentCategory.FORM: "Form",
+        ComponentCategory.MEDIA: "Card",
+        ComponentCategory.FEEDBACK: "Card",
+        ComponentCategory.LAYOUT: "Card",
+        ComponentCategory.EMBED: "WebView"
+    }
 
     def __init__(self):
-        if self._initialized:
-            return
         self._registry: Dict[str, ComponentSchema] = {}
+        self._default_props_cache: Dict[str, Mapping[str, Any]] = {}
+        self._required_props_cache: Dict[str, Tuple[str, ...]] = {}
+        self._fallback_by_type: Dict[str, str] = {}
+        self._by_category: Dict[ComponentCategory, Tuple[str, ...]] = {}
+        self._supports_children: Dict[str, bool] = {}
+        self._supports_actions: Dict[str, bool] = {}
+        self._schema_json: Dict[str, bytes] = {}
+        self._field_type_values: Tuple[str, ...] = tuple(ft.value for ft in FormFieldType)
+        self._valid_field_types: FrozenSet[str] = frozenset(self._field_type_values)
         self._register_builtin_components()
-        self._initialized = True
 
     def _register_builtin_components(self):
         """Register built-in components (v0.8.0 - 12 components)"""
@@ -94,7 +148,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="Markdown",
             category=ComponentCategory.DISPLAY,
-            required_props=[],
             optional_props={
                 "content": "",
                 "allowHtml": False,
@@ -107,7 +160,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="Collapse",
             category=ComponentCategory.DISPLAY,
-            required_props=[],
             optional_props={
                 "items": [],  # CollapseItem[]
                 "accordion": False,
@@ -121,7 +173,7 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="AppCard",
             category=ComponentCategory.CARD,
-            required_props=["id", "title"],
+            required_props=("id", "title"),
             optional_props={
                 "id": "",
                 "title": "",
@@ -141,7 +193,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="Form",
             category=ComponentCategory.FORM,
-            required_props=[],
             optional_props={
                 "title": "",
                 "description": "",
@@ -164,7 +215,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="VideoPlayer",
             category=ComponentCategory.MEDIA,
-            required_props=[],
             optional_props={
                 "src": "",
                 "poster": "",
@@ -182,7 +232,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="AudioPlayer",
             category=ComponentCategory.MEDIA,
-            required_props=[],
             optional_props={
                 "src": "",
                 "title": "",
@@ -196,7 +245,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="ImageGallery",
             category=ComponentCategory.MEDIA,
-            required_props=[],
             optional_props={
                 "images": [],  # [{src, alt, thumbnail, caption}]
                 "layout": "grid",  # grid | carousel
@@ -211,7 +259,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="Alert",
             category=ComponentCategory.FEEDBACK,
-            required_props=[],
             optional_props={
                 "type": "info",  # info | success | warning | error
                 "message": "",
@@ -227,7 +274,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="Progress",
             category=ComponentCategory.FEEDBACK,
-            required_props=[],
             optional_props={
                 "value": 0,
                 "max": 100,
@@ -244,7 +290,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="Card",
             category=ComponentCategory.LAYOUT,
-            required_props=[],
             optional_props={
                 "title": "",
                 "subtitle": "",
@@ -273,7 +318,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="Modal",
             category=ComponentCategory.LAYOUT,
-            required_props=[],
             optional_props={
                 "title": "",
                 "mode": "modal",  # modal | drawer
@@ -293,7 +337,6 @@ class ComponentCatalog:
         self.register(ComponentSchema(
             type="WebView",
             category=ComponentCategory.EMBED,
-            required_props=[],
             optional_props={
                 "url": "",
                 "html": "",
@@ -305,68 +348,75 @@ class ComponentCatalog:
         ))
 
     def register(self, schema: ComponentSchema) -> None:
+        previous = self._registry.get(schema.type)
+        if previous is not None:
+            self._by_category[previous.category] = tuple(
+                t for t in self._by_category[previous.category] if t != schema.type)
         self._registry[schema.type] = schema
+        self._by_category[schema.category] = self._by_category.get(schema.category, ()) + (schema.type,)
+        self._default_props_cache[schema.type] = _freeze(dict(schema.optional_props))
+        self._required_props_cache[schema.type] = schema.required_props
+        self._fallback_by_type[schema.type] = self._FALLBACK_BY_CATEGORY.get(schema.category, "Card")
+        self._supports_children[schema.type] = schema.supports_children
+        self._supports_actions[schema.type] = schema.supports_actions
+        self._schema_json[schema.type] = json.dumps(schema.to_dict(), ensure_ascii=False).encode("utf-8")
 
     def get(self, component_type: str) -> Optional[ComponentSchema]:
         return self._registry.get(component_type)
 
+    def get_schema_json(self, component_type: str) -> Optional[bytes]:
+        """Get the schema as UTF-8 JSON bytes, serialized once at registration"""
+        return self._schema_json.get(component_type)
+
     def is_valid_type(self, component_type: str) -> bool:
         return component_type in self._registry
 
-    def get_all_types(self) -> Set[str]:
-        return set(self._registry.keys())
+    def get_all_types(self) -> KeysView[str]:
+        """Get a live, set-like view of registered types (copy with set() if mutating)"""
+        return self._registry.keys()
 
-    def get_types_by_category(self, category: ComponentCategory) -> List[str]:
-        return [s.type for s in self._registry.values() if s.category == category]
+    def get_types_by_category(self, category: ComponentCategory) -> Tuple[str, ...]:
+        return self._by_category.get(category, ())
 
     def get_default_props(self, component_type: str) -> Dict[str, Any]:
-        schema = self.get(component_type)
-        return schema.optional_props.copy() if schema else {}
+        """Get a mutable copy of default props (nested dicts/lists are copied too)"""
+        defaults = self._default_props_cache.get(component_type)
+        return _thaw(defaults) if defaults is not None else {}
 
-    def get_required_props(self, component_type: str) -> List[str]:
-        schema = self.get(component_type)
-        return schema.required_props.copy() if schema else []
+    def get_default_props_readonly(self, component_type: str) -> Mapping[str, Any]:
+        """
+        Get a deeply read-only view of default props, without copying
+
+        Nested dicts are read-only mappings and lists are tuples, frozen at registration.
+        """
+        return self._default_props_cache.get(component_type, _EMPTY_PROPS)
+
+    def get_required_props(self, component_type: str) -> Tuple[str, ...]:
+        return self._required_props_cache.get(component_type, ())
 
     def supports_children(self, component_type: str) -> bool:
-        schema = self.get(component_type)
-        return schema.supports_children if schema else False
+        return self._supports_children.get(component_type, False)
 
     def supports_actions(self, component_type: str) -> bool:
-        schema = self.get(component_type)
-        return schema.supports_actions if schema else False
+        return self._supports_actions.get(component_type, False)
 
     def get_fallback_type(self, component_type: str) -> str:
         """Get fallback type for a component"""
-        schema = self.get(component_type)
-        if not schema:
-            return "Card"
-        fallback_map = {
-            ComponentCategory.DISPLAY: "Markdown",
-            ComponentCategory.CARD: "Card",
-            ComponentCategory.FORM: "Form",
-            ComponentCategory.MEDIA: "Card",
-            ComponentCategory.FEEDBACK: "Card",
-            ComponentCategory.LAYOUT: "Card",
-            ComponentCategory.EMBED: "WebView"
-        }
-        return fallback_map.get(schema.category, "Card")
+        return self._fallback_by_type.get(component_type, "Card")
 
     def is_valid_field_type(self, field_type: str) -> bool:
-        try:
-            FormFieldType(field_type)
-            return True
-        except ValueError:
-            return False
+        return isinstance(field_type, str) and field_type in self._valid_field_types
 
-    def get_field_type_values(self) -> List[str]:
-        return [ft.value for ft in FormFieldType]
+    def get_field_type_values(self) -> Tuple[str, ...]:
+        return self._field_type_values
 
 
-# Global singleton
+# Global singleton, built once at import time (module import is serialized, so this is thread-safe)
 catalog = ComponentCatalog()
 
 
 def get_catalog() -> ComponentCatalog:
+    """Get the shared catalog; use this instead of constructing ComponentCatalog()"""
     return catalog
 
 
@@ -10,17 +10,32 @@ Agent output intent -> Intent parsing -> Component generation -> Tree building -
 """
 
 import json
+import re
 import sys
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, Any, Optional, List, Tuple, Callable, Iterable, Sequence
+from dataclasses import dataclass
 from enum import Enum
 
-from catalog import get_catalog, ComponentCategory, FormFieldType
+from catalog import get_catalog, ComponentCategory, FormFieldType, _DATACLASS_OPTIONS
 from validator import get_validator, ValidationResult, validate_with_fallback
 
+# Tree metadata skeleton, copied per tree (empty errors/warnings are shared immutable tuples)
+_METADATA_TEMPLATE: Dict[str, Any] = {
+    "version": "",
+    "intent": "",
+    "validation_status": "valid",
+    "errors": (),
+    "warnings": (),
+    "generated_at": ""
+}
 
-class IntentType(Enum):
+# Shared encoder for format_json; json.dumps() with options builds a new JSONEncoder per call
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+class IntentType(str, Enum):
     """Intent types"""
     REPLY = "reply"              # Text reply -> Markdown
     CODE = "code"                # Code reply -> Markdown (with codeOptions)
@@ -38,7 +53,40 @@ class IntentType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# First code fence: language on the opening line, then (if closed) the body up to the closing fence
+_CODE_FENCE_RE = re.compile(r"^```([^\n]*)(?:\n(.*?)^```)?", re.M | re.S)
+
+# Optional Form field properties copied through by _handle_form
+_FIELD_PASSTHROUGH = frozenset({
+    "placeholder", "defaultValue", "required", "disabled", "helperText",
+    "options", "min", "max", "minLength", "maxLength", "pattern",
+    "multiple", "searchable", "rows", "showToggle", "validation", "visibleWhen"
+})
+
+# Form action types rendered with the primary variant by default
+# (a tuple, not a set: action "type" comes from input and may be unhashable)
+_PRIMARY_ACTION_TYPES = ("submit", "confirm")
+
+# Intent string (lowercase) -> IntentType, including aliases
+_INTENT_MAP: Dict[str, IntentType] = {
+    "reply": IntentType.REPLY, "text": IntentType.REPLY, "message": IntentType.REPLY,
+    "code": IntentType.CODE,
+    "form": IntentType.FORM, "input": IntentType.FORM,
+    "confirm": IntentType.CONFIRM,
+    "select": IntentType.SELECT, "choose": IntentType.SELECT,
+    "alert": IntentType.ALERT, "info": IntentType.ALERT,
+    "warn": IntentType.WARN, "warning": IntentType.WARN,
+    "error": IntentType.ERROR,
+    "success": IntentType.SUCCESS,
+    "data": IntentType.DATA,
+    "media": IntentType.MEDIA,
+    "progress": IntentType.PROGRESS,
+    "app": IntentType.APP, "skill": IntentType.APP,
+    "work": IntentType.APP, "ai_work": IntentType.APP,
+}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FormatterConfig:
     """Formatter configuration"""
     enable_fallback: bool = True
@@ -48,16 +96,29 @@ class FormatterConfig:
     version: str = "v0.8.0"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FormatterResult:
     """Formatting result"""
     success: bool
     tree: Optional[Dict[str, Any]] = None
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+    errors: Sequence[str] = ()  # Shared empty tuple until the first add_error()
+    warnings: Sequence[str] = ()  # Shared empty tuple until the first add_warnings()
     fallback_applied: bool = False
     intent: Optional[str] = None
 
+    def add_error(self, message: str):
+        self.add_errors((message,))
+
+    def add_errors(self, messages: Iterable[str]):
+        if not isinstance(self.errors, list):
+            self.errors = list(self.errors)
+        self.errors.extend(messages)
+
+    def add_warnings(self, messages: Iterable[str]):
+        if not isinstance(self.warnings, list):
+            self.warnings = list(self.warnings)
+        self.warnings.extend(messages)
+
 
 class UIFormatter:
     """
@@ -67,59 +128,44 @@ class UIFormatter:
     1. Intent parsing - Identify input intent type
     2. Component generation - Generate matching component
     3. Tree building - Build flat tree (Card/Form as root container)
-    4. Validation + Fallback - Degrade to Markdown after 3 failed validation rounds
+    4. Validation + Fallback - Degrade to Markdown once validation (and any fix rounds) fail
     """
 
+    # Shared singletons, bound once for all instances
+    catalog = get_catalog()
+    validator = get_validator()
+
     def __init__(self, config: Optional[FormatterConfig] = None):
         self.config = config or FormatterConfig()
-        self.catalog = get_catalog()
-        self.validator = get_validator()
-        self._id_counter: Dict[str, int] = {}
-
-    def _generate_id(self, component_type: str) -> str:
-        """Generate unique ID"""
-        if component_type not in self._id_counter:
-            self._id_counter[component_type] = 0
-        idx = self._id_counter[component_type]
-        self._id_counter[component_type] += 1
-        prefix = self.config.id_prefix
-        type_lower = component_type.lower()
-        return f"{prefix}{type_lower}_{idx}" if prefix else f"{type_lower}_{idx}"
-
-    def _reset_id_counter(self):
-        self._id_counter = {}
+
+        # Intent -> bound single-argument handler; intents not listed use _handle_unknown
+        self._dispatch: Dict[IntentType, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            IntentType.REPLY: self._handle_reply,
+            IntentType.CODE: self._handle_code,
+            IntentType.FORM: self._handle_form,
+            IntentType.CONFIRM: self._handle_confirm,
+            IntentType.SELECT: self._handle_select,
+            IntentType.ALERT: partial(self._handle_alert, alert_type="info"),
+            IntentType.WARN: partial(self._handle_alert, alert_type="warning"),
+            IntentType.ERROR: partial(self._handle_alert, alert_type="error"),
+            IntentType.SUCCESS: partial(self._handle_alert, alert_type="success"),
+            IntentType.PROGRESS: self._handle_progress,
+            IntentType.MEDIA: self._handle_media,
+            IntentType.DATA: self._handle_data,
+            IntentType.APP: self._handle_app,
+        }
 
     # ========== Intent Parsing ==========
 
     def _parse_intent(self, input_data: Dict[str, Any]) -> IntentType:
         """Parse input intent"""
-        intent_str = input_data.get("intent", "").lower()
-
-        intent_map = {
-            "reply": IntentType.REPLY, "text": IntentType.REPLY, "message": IntentType.REPLY,
-            "code": IntentType.CODE,
-            "form": IntentType.FORM, "input": IntentType.FORM,
-            "confirm": IntentType.CONFIRM,
-            "select": IntentType.SELECT, "choose": IntentType.SELECT,
-            "alert": IntentType.ALERT, "info": IntentType.ALERT,
-            "warn": IntentType.WARN, "warning": IntentType.WARN,
-            "error": IntentType.ERROR,
-            "success": IntentType.SUCCESS,
-            "data": IntentType.DATA,
-            "media": IntentType.MEDIA,
-            "progress": IntentType.PROGRESS,
-            "app": IntentType.APP, "skill": IntentType.APP,
-            "work": IntentType.APP, "ai_work": IntentType.APP,
-        }
-
-        if intent_str in intent_map:
-            return intent_map[intent_str]
+        return _INTENT_MAP.get(input_data.get("intent", "").lower()) or self._infer_intent(input_data)
 
-        # Infer from content
-        if "content" in input_data and isinstance(input_data["content"], str):
-            if "```" in input_data["content"] or input_data.get("language"):
-                return IntentType.CODE
-            return IntentType.REPLY
+    def _infer_intent(self, input_data: Dict[str, Any]) -> IntentType:
+        """Infer intent from content when no known intent is given"""
+        content = input_data.get("content")
+        if isinstance(content, str):
+            return IntentType.CODE if "```" in content or input_data.get("language") else IntentType.REPLY
 
         if "fields" in input_data:
             return IntentType.FORM
@@ -144,22 +190,18 @@ class UIFormatter:
 
     def _handle_code(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate code Markdown component"""
-        code = input_data.get("code", input_data.get("content", ""))
+        code = input_data["code"] if "code" in input_data else input_data.get("content", "")
         language = input_data.get("language", "text")
 
         # Extract from markdown code block
         if "```" in code:
-            lines = code.split("\n")
-            for i, line in enumerate(lines):
-                if line.startswith("```"):
-                    lang = line[3:].strip()
-                    if lang:
-                        language = lang
-                    for j in range(i + 1, len(lines)):
-                        if lines[j].startswith("```"):
-                            code = "\n".join(lines[i + 1:j])
-                            break
-                    break
+            match = _CODE_FENCE_RE.search(code)
+            if match:
+                language = match.group(1).strip() or language
+                body = match.group(2)
+                if body is not None:
+                    # Drop the newline that precedes the closing fence
+                    code = body[:-1] if body else body
 
         return {
             "type": "Markdown",
@@ -177,35 +219,19 @@ class UIFormatter:
         fields = input_data.get("fields", [])
         actions = input_data.get("actions", [{"label": "Submit", "type": "submit", "variant": "primary"}])
 
-        # Normalize fields
-        normalized_fields = []
-        for f in fields:
-            field_def = {
-                "name": f.get("name", f"field_{len(normalized_fields)}"),
-                "type": f.get("type", f.get("type", "text")),
+        # Normalize fields (known optional properties are copied through in input order)
+        normalized_fields = [
+            {
+                "name": f.get("name", f"field_{i}"),
+                "type": f.get("type", "text"),
                 "label": f.get("label", ""),
+                **{k: v for k, v in f.items() if k in _FIELD_PASSTHROUGH}
             }
-            # Copy additional properties
-            for key in ["placeholder", "defaultValue", "required", "disabled", "helperText",
-                        "options", "min", "max", "minLength", "maxLength", "pattern",
-                        "multiple", "searchable", "rows", "showToggle", "validation", "visibleWhen"]:
-                if key in f:
-                    field_def[key] = f[key]
-            normalized_fields.append(field_def)
+            for i, f in enumerate(fields)
+        ]
 
         # Normalize actions
-        normalized_actions = []
-        for a in actions:
-            action_def = {
-                "label": a.get("label", "Submit"),
-                "type": a.get("type", "submit"),
-                "variant": a.get("variant", "primary" if a.get("type") in ["submit", "confirm"] else "secondary")
-            }
-            if "action" in a:
-                action_def["action"] = a["action"]
-            if a.get("disabled"):
-                action_def["disabled"] = True
-            normalized_actions.append(action_def)
+        normalized_actions = [self._normalize_form_action(a) for a in actions]
 
         return {
             "type": "Form",
@@ -219,10 +245,23 @@ class UIFormatter:
             }
         }
 
+    @staticmethod
+    def _normalize_form_action(a: Dict[str, Any]) -> Dict[str, Any]:
+        action_def = {
+            "label": a.get("label", "Submit"),
+            "type": a.get("type", "submit"),
+            "variant": a.get("variant", "primary" if a.get("type") in _PRIMARY_ACTION_TYPES else "secondary")
+        }
+        if "action" in a:
+            action_def["action"] = a["action"]
+        if a.get("disabled"):
+            action_def["disabled"] = True
+        return action_def
+
     def _handle_confirm(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate confirmation Card component (Card with actions)"""
         title = input_data.get("title", "Confirm")
-        content = input_data.get("description", input_data.get("content", ""))
+        content = input_data["description"] if "description" in input_data else input_data.get("content", "")
         actions = input_data.get("actions", [
             {"label": "Confirm", "variant": "primary"},
             {"label": "Cancel", "variant": "outline"}
@@ -291,7 +330,7 @@ class UIFormatter:
 
     def _handle_alert(self, input_data: Dict[str, Any], alert_type: str = "info") -> Dict[str, Any]:
         """Generate Alert component"""
-        message = input_data.get("message", input_data.get("content", ""))
+        message = input_data["message"] if "message" in input_data else input_data.get("content", "")
         description = input_data.get("description", "")
         actions = input_data.get("actions", [])
 
@@ -325,7 +364,7 @@ class UIFormatter:
         """Generate media component"""
         media_type = input_data.get("media_type", "image").lower()
         src = input_data.get("src", "")
-        sources = input_data.get("sources", [src] if src else [])
+        sources = input_data["sources"] if "sources" in input_data else ([src] if src else [])
 
         if media_type == "video":
             return {
@@ -372,18 +411,18 @@ class UIFormatter:
             return {"type": "Markdown", "props": {"content": title or "No data"}}
 
         # Build Markdown table
-        headers = [c.get("title", c.get("key", "")) for c in columns]
+        headers = [c["title"] if "title" in c else c.get("key", "") for c in columns]
         keys = [c.get("key", "") for c in columns]
 
-        lines = []
+        sep = " | "
+        blanks = [""] * len(keys)  # Per-key default, so map(row.get, keys, blanks) calls row.get(k, "")
+        lines = [
+            f"| {sep.join(headers)} |",
+            f"| {sep.join(['---'] * len(headers))} |",
+            "\n".join(f"| {sep.join(map(str, map(row.get, keys, blanks)))} |" for row in data)
+        ]
         if title:
-            lines.append(f"## {title}\n")
-        lines.append("| " + " | ".join(headers) + " |")
-        lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
-
-        for row in data:
-            cells = [str(row.get(k, "")) for k in keys]
-            lines.append("| " + " | ".join(cells) + " |")
+            lines.insert(0, f"## {title}\n")
 
         return {
             "type": "Markdown",
@@ -408,14 +447,18 @@ class UIFormatter:
             }
         }
 
+    def _handle_unknown(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Unknown intent, treat as text"""
+        content = input_data["content"] if "content" in input_data else str(input_data)
+        return {"type": "Markdown", "props": {"content": content}}
+
     # ========== Tree Building ==========
 
     def _build_tree(self, component: Dict[str, Any], intent: IntentType) -> Dict[str, Any]:
         """Build flat tree structure"""
-        self._reset_id_counter()
-
         comp_type = component.get("type", "Markdown")
-        comp_id = self._generate_id(comp_type)
+        # Trees hold a single element, so its id is always index 0
+        comp_id = f"{self.config.id_prefix}{comp_type.lower()}_0"
 
         element = {
             "id": comp_id,
@@ -424,21 +467,17 @@ class UIFormatter:
             "children": []
         }
 
-        tree = {
+        metadata = _METADATA_TEMPLATE.copy()
+        metadata["version"] = self.config.version
+        metadata["intent"] = intent.value
+        metadata["generated_at"] = datetime.now().astimezone().isoformat(timespec="seconds")
+
+        return {
             "root": comp_id,
             "elements": {comp_id: element},
-            "metadata": {
-                "version": self.config.version,
-                "intent": intent.value,
-                "validation_status": "valid",
-                "errors": [],
-                "warnings": [],
-                "generated_at": datetime.now().astimezone().isoformat()
-            }
+            "metadata": metadata
         }
 
-        return tree
-
     # ========== Main Format Method ==========
 
     def format(self, input_data: Dict[str, Any]) -> FormatterResult:
@@ -460,67 +499,51 @@ class UIFormatter:
         """
         result = FormatterResult(success=True)
 
+        if not isinstance(input_data, dict):
+            result.success = False
+            result.add_error(f"Formatting failed: expected an object, got {type(input_data).__name__}")
+            return result
+
+        # Fast path: a text reply is always a single valid Markdown element, skip dispatch + validation
+        if input_data.get("intent") == "reply" and isinstance(input_data.get("content"), str):
+            result.intent = IntentType.REPLY.value
+            result.tree = self._build_tree(self._handle_reply(input_data), IntentType.REPLY)
+            return result
+
+        # 1-2. Parse intent and generate component (handlers read caller-supplied values and may raise)
         try:
-            # 1. Parse intent
             intent = self._parse_intent(input_data)
             result.intent = intent.value
+            component = self._dispatch.get(intent, self._handle_unknown)(input_data)
+        except Exception as e:
+            result.success = False
+            result.add_error(f"Formatting failed: {str(e)}")
+            return result
 
-            # 2. Generate component based on intent
-            if intent == IntentType.REPLY:
-                component = self._handle_reply(input_data)
-            elif intent == IntentType.CODE:
-                component = self._handle_code(input_data)
-            elif intent == IntentType.FORM:
-                component = self._handle_form(input_data)
-            elif intent == IntentType.CONFIRM:
-                component = self._handle_confirm(input_data)
-            elif intent == IntentType.SELECT:
-                component = self._handle_select(input_data)
-            elif intent == IntentType.ALERT:
-                component = self._handle_alert(input_data, "info")
-            elif intent == IntentType.WARN:
-                component = self._handle_alert(input_data, "warning")
-            elif intent == IntentType.ERROR:
-                component = self._handle_alert(input_data, "error")
-            elif intent == IntentType.SUCCESS:
-                component = self._handle_alert(input_data, "success")
-            elif intent == IntentType.PROGRESS:
-                component = self._handle_progress(input_data)
-            elif intent == IntentType.MEDIA:
-                component = self._handle_media(input_data)
-            elif intent == IntentType.DATA:
-                component = self._handle_data(input_data)
-            elif intent == IntentType.APP:
-                component = self._handle_app(input_data)
-            else:
-                # Unknown intent, treat as text
-                content = input_data.get("content", str(input_data))
-                component = {"type": "Markdown", "props": {"content": content}}
-
-            # 3. Build tree
-            tree = self._build_tree(component, intent)
+        # 3. Build tree
+        tree = self._build_tree(component, intent)
 
-            # 4. Validate + Fallback
+        # 4. Validate + Fallback
+        try:
             if self.config.enable_fallback:
-                validation_result, final_tree = validate_with_fallback(tree)
-                if validation_result.warnings:
-                    result.warnings.extend([w.message for w in validation_result.warnings])
-                    result.fallback_applied = True
-                tree = final_tree
+                validation_result, tree = validate_with_fallback(tree)
             else:
                 validation_result = self.validator.validate_tree(tree)
-                if not validation_result.is_valid:
-                    if self.config.strict_validation:
-                        result.success = False
-                        result.errors.extend([e.message for e in validation_result.errors])
-                        return result
-
-            result.tree = tree
-
         except Exception as e:
             result.success = False
-            result.errors.append(f"Formatting failed: {str(e)}")
+            result.add_error(f"Formatting failed: {str(e)}")
+            return result
+
+        if self.config.enable_fallback:
+            if validation_result.warnings:
+                result.add_warnings(w.message for w in validation_result.warnings)
+                result.fallback_applied = True
+        elif not validation_result.is_valid and self.config.strict_validation:
+            result.success = False
+            result.add_errors(e.message for e in validation_result.errors)
+            return result
 
+        result.tree = tree
         return result
 
     def format_json(self, input_json: str) -> str:
@@ -528,10 +551,10 @@ class UIFormatter:
         try:
             input_data = json.loads(input_json)
         except json.JSONDecodeError as e:
-            return json.dumps({
+            return _JSON_ENCODER.encode({
                 "success": False,
                 "errors": [f"JSON parse error: {str(e)}"]
-            }, ensure_ascii=False, indent=2)
+            })
 
         result = self.format(input_data)
 
@@ -546,14 +569,23 @@ class UIFormatter:
         if result.fallback_applied:
             output["fallback_applied"] = True
 
-        return json.dumps(output, ensure_ascii=False, indent=2)
+        return _JSON_ENCODER.encode(output)
 
 
 # ========== Convenience Functions ==========
 
+_default_formatter: Optional[UIFormatter] = None
+
+
 def format_output(input_data: Dict[str, Any], **config_kwargs) -> FormatterResult:
-    config = FormatterConfig(**config_kwargs)
-    return UIFormatter(config).format(input_data)
+    if config_kwargs:
+        return UIFormatter(FormatterConfig(**config_kwargs)).format(input_data)
+
+    # Default config: reuse one formatter (it keeps no per-call state)
+    global _default_formatter
+    if _default_formatter is None:
+        _default_formatter = UIFormatter()
+    return _default_formatter.format(input_data)
 
 
 def format_reply(content: str) -> FormatterResult:
@@ -6,15 +6,32 @@ Three-layer validation:
 2. Field layer - Property type and value validation
 3. Tree structure layer - Reference integrity and cycle detection
 
-Supports all 12 component types, 3-round validation retry + Markdown fallback.
+Supports all 12 component types, up to 3 validation rounds with a fix callback + Markdown fallback.
 """
 
 import re
 import json
-from typing import Dict, Any, Optional, List, Literal
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Literal, Callable, Tuple, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
-from catalog import get_catalog, FormFieldType
+from catalog import get_catalog, FormFieldType, _DATACLASS_OPTIONS
+
+# Field types that must come with a non-empty options list
+_NEEDS_OPTIONS = frozenset({FormFieldType.SELECT.value, FormFieldType.RADIO.value})
+
+# Field types are fixed by FormFieldType: set for lookups, joined once for "Invalid type" messages
+_VALID_FIELD_TYPES = frozenset(ft.value for ft in FormFieldType)
+_FIELD_TYPES_STR = ", ".join(ft.value for ft in FormFieldType)
+
+# Props copied into the Markdown fallback, in output order, with an optional formatter
+_FALLBACK_FIELDS = (
+    ("content", None),
+    ("title", "## {}".format),
+    ("message", None),
+    ("description", None),
+)
 
 
 # ==================== Validation Rule Definitions ====================
@@ -34,7 +51,7 @@ class ValidationType(str, Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationError:
     """Validation error"""
     path: str
@@ -42,43 +59,118 @@ class ValidationError:
     error_type: str = "error"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationResult:
     """Validation result"""
     is_valid: bool
     errors: List[ValidationError] = field(default_factory=list)
     warnings: List[ValidationError] = field(default_factory=list)
     attempt: int = 1  # Current validation round
+    # Serialized (errors, warnings) for to_dict(), reset by the add_* methods
+    _dict_cache: Optional[Tuple[List[Dict[str, str]], List[Dict[str, str]]]] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def add_error(self, path: str, message: str):
         self.errors.append(ValidationError(path=path, message=message))
         self.is_valid = False
+        self._dict_cache = None
+
+    def add_errors(self, pairs: Iterable[Tuple[str, str]]):
+        """Add several (path, message) errors at once"""
+        errors = [ValidationError(path=path, message=message) for path, message in pairs]
+        if errors:
+            self.errors.extend(errors)
+            self.is_valid = False
+            self._dict_cache = None
 
     def add_warning(self, path: str, message: str):
         self.warnings.append(ValidationError(path=path, message=message, error_type="warning"))
+        self._dict_cache = None
 
     def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize to a plain dict
+
+        The errors/warnings lists are built once and shared between calls until the next
+        add_*() call; treat them as read-only.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = (
+                [{"path": e.path, "message": e.message} for e in self.errors],
+                [{"path": w.path, "message": w.message} for w in self.warnings]
+            )
+        errors, warnings = self._dict_cache
         return {
             "is_valid": self.is_valid,
             "attempt": self.attempt,
-            "errors": [{"path": e.path, "message": e.message} for e in self.errors],
-            "warnings": [{"path": w.path, "message": w.message} for w in self.warnings]
+            "errors": errors,
+            "warnings": warnings
         }
 
 
+# ==================== Form Field Checks ====================
+
+def _form_field_errors(fields: Tuple[Tuple[Any, ...], ...]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Check Form fields given as (name, type, has_options, min, max) tuples
+
+    Returns (path suffix, message) pairs, e.g. ("[0].name", ...), relative to the fields prop.
+    Pure, so identical field lists can be served from _form_field_errors_cached.
+    """
+    name_counts = Counter(f[0] for f in fields if f[0])
+    seen_duplicates = set()  # Only names that occur more than once are tracked
+    errors = []
+    append = errors.append
+
+    for i, (name, field_type, has_options, min_val, max_val) in enumerate(fields):
+        # Check name (first occurrence of a duplicated name passes, later ones are errors)
+        if not name:
+            append((f"[{i}].name", "Field must specify a name"))
+        elif name_counts[name] > 1:
+            if name in seen_duplicates:
+                append((f"[{i}].name", f"Duplicate field name: {name}"))
+            else:
+                seen_duplicates.add(name)
+
+        # Check type (str check first: unhashable JSON values cannot be set members)
+        if not (isinstance(field_type, str) and field_type in _VALID_FIELD_TYPES):
+            append((f"[{i}].type", f"Invalid type: {field_type}, valid values: {_FIELD_TYPES_STR}"))
+
+        # Validate select/radio must have options
+        elif field_type in _NEEDS_OPTIONS:
+            if not has_options:
+                append((f"[{i}].options", f"type={field_type} requires options"))
+
+        # Validate slider min/max
+        elif field_type == "slider":
+            if min_val is not None and max_val is not None and min_val >= max_val:
+                append((f"[{i}]", "Slider min must be less than max"))
+
+    return tuple(errors)
+
+
+_form_field_errors_cached = lru_cache(maxsize=512)(_form_field_errors)
+
+
 # ==================== Validator Class ====================
 
 class UIValidator:
     """
     UI Validator v0.8.0
 
-    Supports 3-round validation retry, falls back to Markdown on failure
+    Retries up to 3 rounds when given a fix callback, falls back to Markdown on failure
     """
 
     MAX_ATTEMPTS = 3  # Maximum validation rounds
 
     def __init__(self):
         self.catalog = get_catalog()
+        # Component type -> element checker specialized to its schema, built on first use
+        self._compiled: Dict[str, Callable[[Dict[str, Any], str, ValidationResult], None]] = {}
+
+    def clear_cache(self):
+        """Drop per-type element checkers (e.g. after registering components)"""
+        self._compiled.clear()
 
     def validate_tree(self, tree_data: Dict[str, Any], attempt: int = 1) -> ValidationResult:
         """Validate entire UI tree"""
@@ -100,131 +192,158 @@ class UIValidator:
             result.add_error("root", f"Root element '{root_id}' not found")
             return result
 
-        # Validate each element
-        for elem_id, elem_data in elements.items():
-            self._validate_element(elem_data, f"elements.{elem_id}", elements, result)
+        # Validate each element (catalog lookups bound once for the loop)
+        is_valid_type = self.catalog.is_valid_type
+        compiled = self._compiled
+        valid_types_str = None
 
-        # Validate child reference integrity
-        all_ids = set(elements.keys())
+        # Paths are only formatted when an error/warning is actually reported
         for elem_id, elem_data in elements.items():
-            for child_id in elem_data.get("children", []):
-                if child_id not in all_ids:
-                    result.add_error(f"elements.{elem_id}.children", f"References non-existent child: {child_id}")
-
-        # Detect circular references
-        self._detect_cycles(root_id, elements, result)
+            elem_type = elem_data.get("type")
 
-        # Detect orphan elements
-        self._detect_orphans(root_id, elements, result)
+            if not elem_type:
+                result.add_error(f"elements.{elem_id}.type", "Missing component type")
+                continue
 
-        return result
+            if not is_valid_type(elem_type):
+                if valid_types_str is None:
+                    valid_types_str = ", ".join(self.catalog.get_all_types())
+                result.add_error(f"elements.{elem_id}.type",
+                    f"Unknown component type: {elem_type}, valid types: {valid_types_str}")
+                continue
 
-    def _validate_element(self, element: Dict[str, Any], path: str,
-                          elements: Dict[str, Any], result: ValidationResult):
-        """Validate a single element"""
-        elem_type = element.get("type")
+            check = compiled.get(elem_type)
+            if check is None:
+                check = compiled[elem_type] = self._compile_element_check(elem_type)
+            check(elem_data, elem_id, result)
 
-        if not elem_type:
-            result.add_error(f"{path}.type", "Missing component type")
-            return
+        # Child reference integrity, circular references and orphans
+        self._walk_tree(root_id, elements, result)
 
-        if not self.catalog.is_valid_type(elem_type):
-            result.add_error(f"{path}.type",
-                f"Unknown component type: {elem_type}, valid types: {', '.join(self.catalog.get_all_types())}")
-            return
+        return result
 
-        # Validate props
+    def _compile_element_check(self, elem_type: str) -> Callable[[Dict[str, Any], str, ValidationResult], None]:
+        """Build a props/children checker (element, elem_id, result) with the schema of elem_type baked in"""
         schema = self.catalog.get(elem_type)
-        props = element.get("props", {})
+        required_props = schema.required_props
+        required_props_fs = schema.required_props_fs
+        children_warning = None if schema.supports_children else f"Component {elem_type} does not support children"
+        validate_form_fields = self._validate_form_fields if elem_type == "Form" else None
+
+        def check(element: Dict[str, Any], elem_id: str, result: ValidationResult):
+            props = element.get("props", {})
+
+            # Check required properties (one set difference for dict props; errors keep schema order).
+            # Schemas without required props never look at props, so None/scalar props pass as before.
+            if required_props_fs:
+                if isinstance(props, dict):
+                    missing = required_props_fs.difference(props)
+                else:
+                    missing = {required_prop for required_prop in required_props if required_prop not in props}
+            else:
+                missing = None
+            if missing:
+                result.add_errors(
+                    (f"elements.{elem_id}.props.{required_prop}", f"Missing required property: {required_prop}")
+                    for required_prop in required_props if required_prop in missing)
 
-        # Check required properties
-        for required_prop in schema.required_props:
-            if required_prop not in props:
-                result.add_error(f"{path}.props.{required_prop}", f"Missing required property: {required_prop}")
+            # Validate children
+            if children_warning and element.get("children"):
+                result.add_warning(f"elements.{elem_id}.children", children_warning)
 
-        # Validate children
-        if element.get("children") and not schema.supports_children:
-            result.add_warning(f"{path}.children", f"Component {elem_type} does not support children")
+            # Form-specific validation
+            if validate_form_fields:
+                validate_form_fields(props, elem_id, result)
 
-        # Form-specific validation
-        if elem_type == "Form":
-            self._validate_form_fields(props, path, result)
+        return check
 
-    def _validate_form_fields(self, props: Dict[str, Any], path: str, result: ValidationResult):
+    def _validate_form_fields(self, props: Dict[str, Any], elem_id: str, result: ValidationResult):
         """Validate Form.fields inline field definitions"""
-        fields = props.get("fields", [])
-        field_names = set()
-
-        for i, field_def in enumerate(fields):
-            field_path = f"{path}.props.fields[{i}]"
-
-            # Check name
+        # Reduce each field to what the checks read; identical field lists then share a cached verdict
+        projection = []
+        cacheable = True
+        for field_def in props.get("fields", []):
             name = field_def.get("name")
-            if not name:
-                result.add_error(f"{field_path}.name", "Field must specify a name")
-            elif name in field_names:
-                result.add_error(f"{field_path}.name", f"Duplicate field name: {name}")
-            else:
-                field_names.add(name)
-
-            # Check type
             field_type = field_def.get("type", "text")
-            if not self.catalog.is_valid_field_type(field_type):
-                result.add_error(f"{field_path}.type",
-                    f"Invalid type: {field_type}, valid values: {', '.join(self.catalog.get_field_type_values())}")
-
-            # Validate select/radio must have options
-            if field_type in ["select", "radio"]:
-                if not field_def.get("options"):
-                    result.add_error(f"{field_path}.options", f"type={field_type} requires options")
-
-            # Validate slider min/max
-            if field_type == "slider":
-                min_val = field_def.get("min")
-                max_val = field_def.get("max")
-                if min_val is not None and max_val is not None and min_val >= max_val:
-                    result.add_error(f"{field_path}", "Slider min must be less than max")
-
-    def _detect_cycles(self, root_id: str, elements: Dict[str, Any], result: ValidationResult):
-        """Detect circular references"""
-        visited = set()
-        path_stack = []
-
-        def has_cycle(elem_id: str) -> bool:
-            if elem_id in path_stack:
-                cycle = " -> ".join(path_stack[path_stack.index(elem_id):] + [elem_id])
-                result.add_error("tree", f"Circular reference: {cycle}")
-                return True
-            if elem_id in visited or elem_id not in elements:
-                return False
-
-            visited.add(elem_id)
-            path_stack.append(elem_id)
-
-            for child_id in elements[elem_id].get("children", []):
-                if has_cycle(child_id):
-                    return True
-
-            path_stack.pop()
-            return False
-
-        has_cycle(root_id)
-
-    def _detect_orphans(self, root_id: str, elements: Dict[str, Any], result: ValidationResult):
-        """Detect orphan elements"""
-        reachable = set()
+            # Only str names/types: 1, 1.0 and True hash alike but render differently in messages
+            if cacheable and not ((name is None or name.__class__ is str) and field_type.__class__ is str):
+                cacheable = False
+            projection.append((name, field_type, bool(field_def.get("options")),
+                               field_def.get("min"), field_def.get("max")))
+        fields = tuple(projection)
+
+        errors = None
+        if cacheable:
+            try:
+                errors = _form_field_errors_cached(fields)
+            except TypeError:
+                pass  # Unhashable min/max (or incomparable values, re-raised below)
+        if errors is None:
+            errors = _form_field_errors(fields)
+
+        if errors:
+            prefix = f"elements.{elem_id}.props.fields"
+            result.add_errors((prefix + suffix, message) for suffix, message in errors)
+
+    def _walk_tree(self, root_id: str, elements: Dict[str, Any], result: ValidationResult):
+        """
+        Tree structure checks
 
-        def mark_reachable(elem_id: str):
-            if elem_id in reachable or elem_id not in elements:
-                return
-            reachable.add(elem_id)
-            for child_id in elements[elem_id].get("children", []):
-                mark_reachable(child_id)
+        - Children referencing non-existent elements (in element order)
+        - First circular reference and orphan elements, from a single iterative DFS from root
 
-        mark_reachable(root_id)
+        The walk runs over integer indices (position in elements), so ids are only hashed
+        once while building the adjacency list.
+        """
+        ids = list(elements)
+        index = {elem_id: i for i, elem_id in enumerate(ids)}
+        adj: List[List[int]] = []
+        dangling = []
+        for elem_id, elem_data in elements.items():
+            children = []
+            for child_id in elem_data.get("children", []):
+                child = index.get(child_id)
+                if child is None:
+                    dangling.append((f"elements.{elem_id}.children", f"References non-existent child: {child_id}"))
+                else:
+                    children.append(child)
+            adj.append(children)
+        result.add_errors(dangling)
+
+        # Tri-color DFS: 0 = unvisited, 1 = on the current path, 2 = done
+        color = bytearray(len(ids))
+        root = index[root_id]
+        color[root] = 1
+        path = [root]
+        next_child = [0]  # Per path entry: position of the next child to visit
+        cycle_found = False
+
+        while path:
+            node = path[-1]
+            children = adj[node]
+            pos = next_child[-1]
+            if pos == len(children):
+                # All children done, leave this element
+                color[node] = 2
+                path.pop()
+                next_child.pop()
+                continue
+
+            next_child[-1] = pos + 1
+            child = children[pos]
+            state = color[child]
+            if state == 0:
+                color[child] = 1
+                path.append(child)
+                next_child.append(0)
+            elif state == 1 and not cycle_found:
+                cycle_found = True
+                cycle = " -> ".join([ids[i] for i in path[path.index(child):]] + [ids[child]])
+                result.add_error("tree", f"Circular reference: {cycle}")
 
-        for orphan_id in set(elements.keys()) - reachable:
-            result.add_warning(f"elements.{orphan_id}", "Orphan element, unreachable from root")
+        for i, state in enumerate(color):
+            if not state:
+                result.add_warning(f"elements.{ids[i]}", "Orphan element, unreachable from root")
 
     def validate_with_retry(self, tree_data: Dict[str, Any],
                             fix_callback=None) -> tuple[ValidationResult, Dict[str, Any]]:
@@ -238,7 +357,8 @@ class UIValidator:
         Returns:
             (ValidationResult, final_tree_data)
             - Validation passed: returns original or fixed tree
-            - 3 rounds failed: returns Markdown fallback
+            - All rounds failed: returns Markdown fallback (without a fix_callback there is
+              nothing to retry, so that is after the first round)
         """
         current_data = tree_data
 
@@ -248,46 +368,41 @@ class UIValidator:
             if result.is_valid:
                 return result, current_data
 
-            # Last round still failed, fallback to Markdown
-            if attempt == self.MAX_ATTEMPTS:
-                fallback_tree = self._create_markdown_fallback(current_data, result)
-                fallback_result = ValidationResult(is_valid=True, attempt=attempt)
-                fallback_result.add_warning("fallback",
-                    f"Validation failed after {self.MAX_ATTEMPTS} rounds, degraded to Markdown output")
-                return fallback_result, fallback_tree
+            if attempt == self.MAX_ATTEMPTS or fix_callback is None:
+                break
 
             # Attempt fix
-            if fix_callback:
-                current_data = fix_callback(result.errors, current_data)
+            current_data = fix_callback(result.errors, current_data)
 
-        # Should not reach here
-        return result, current_data
+        # Still failing, fallback to Markdown
+        fallback_tree = self._create_markdown_fallback(current_data, result)
+        fallback_result = ValidationResult(is_valid=True, attempt=attempt)
+        fallback_result.add_warning("fallback",
+            f"Validation failed after {attempt} round(s), degraded to Markdown output")
+        return fallback_result, fallback_tree
 
     def _create_markdown_fallback(self, tree_data: Dict[str, Any],
                                    result: ValidationResult) -> Dict[str, Any]:
         """Create Markdown fallback output"""
         # Try to extract useful content from original data
-        content_parts = []
+        content_parts: List[str] = []
+        append = content_parts.append
 
         elements = tree_data.get("elements", {})
-        for elem_id, elem in elements.items():
-            props = elem.get("props", {})
+        for elem in elements.values():
+            get = elem.get("props", {}).get
 
             # Extract text content
-            if props.get("content"):
-                content_parts.append(props["content"])
-            if props.get("title"):
-                content_parts.append(f"## {props['title']}")
-            if props.get("message"):
-                content_parts.append(props["message"])
-            if props.get("description"):
-                content_parts.append(props["description"])
+            for key, fmt in _FALLBACK_FIELDS:
+                value = get(key)
+                if value:
+                    append(fmt(value) if fmt else value)
 
         # Add validation error info
         if result.errors:
-            content_parts.append("\n---\n**Validation errors:**")
+            append("\n---\n**Validation errors:**")
             for err in result.errors[:5]:  # Show at most 5 errors
-                content_parts.append(f"- {err.message}")
+                append(f"- {err.message}")
 
         fallback_content = "\n\n".join(content_parts) if content_parts else "Content generation failed"
 